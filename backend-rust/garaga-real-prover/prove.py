@@ -8,30 +8,48 @@ This script wraps the local Rust prover binary:
 Modes:
 - setup: generate proving key + VK JSON (and optional sample proof/public-inputs)
 - prove: generate fresh proof/public-input files for one context payload
+- daemon: keep the proving key loaded and serve prove requests on GARAGA_PROVER_SOCK
+
+In prove mode a running daemon (GARAGA_PROVER_SOCK) is used first; the binary is only
+spawned when the socket is absent or refuses the connection.
 """
 
 from __future__ import annotations
 
 import argparse
+import json
 import os
+import socket
+import struct
 import subprocess
 import sys
 from pathlib import Path
+from typing import NoReturn
+
+FRAME_HEADER = struct.Struct(">I")
 
 
-def fail(message: str) -> None:
+def fail(message: str) -> NoReturn:
     print(message, file=sys.stderr)
     raise SystemExit(1)
 
 
+def abs_path(raw: str) -> Path:
+    # Pure string normalization; Path.resolve() would stat every parent directory.
+    return Path(os.path.abspath(os.path.expanduser(raw)))
+
+
 def run(cmd: list[str], cwd: Path) -> None:
-    proc = subprocess.run(
-        cmd,
-        cwd=str(cwd),
-        text=True,
-        capture_output=True,
-        check=False,
-    )
+    try:
+        proc = subprocess.run(
+            cmd,
+            cwd=str(cwd),
+            text=True,
+            capture_output=True,
+            check=False,
+        )
+    except OSError as exc:
+        fail(f"Failed to run command: {' '.join(cmd)}\n{exc}")
     if proc.returncode != 0:
         fail(
             "Command failed.\n"
@@ -41,21 +59,88 @@ def run(cmd: list[str], cwd: Path) -> None:
         )
 
 
-def ensure_binary(project_dir: Path) -> Path:
+def ensure_binary(project_dir: Path, no_build: bool = False) -> Path:
     bin_path = project_dir / "target" / "release" / "garaga-real-prover"
     if not bin_path.is_file():
+        if no_build:
+            fail(f"Prover binary not found and --no-build is set: {bin_path}")
         run(["cargo", "build", "--release"], cwd=project_dir)
     if not bin_path.is_file():
         fail(f"Prover binary not found after build: {bin_path}")
     return bin_path
 
 
+def recv_exact(sock: socket.socket, size: int) -> bytes:
+    chunks = bytearray()
+    while len(chunks) < size:
+        chunk = sock.recv(size - len(chunks))
+        if not chunk:
+            raise ConnectionError("prover daemon closed the connection")
+        chunks.extend(chunk)
+    return bytes(chunks)
+
+
+def prove_via_daemon(
+    sock_path: str,
+    pk_path: Path,
+    context: Path | None,
+    proof_out: Path,
+    public_out: Path,
+    timeout_secs: int,
+) -> bool:
+    if not sock_path or not os.path.exists(sock_path):
+        return False
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    client.settimeout(timeout_secs)
+    try:
+        client.connect(sock_path)
+    except OSError:
+        client.close()
+        return False
+
+    request = {
+        "proof_out": str(proof_out),
+        "public_inputs_out": str(public_out),
+        "context": str(context) if context is not None else None,
+        "pk": str(pk_path),
+    }
+    body = json.dumps(request).encode("utf-8")
+    try:
+        with client:
+            client.sendall(FRAME_HEADER.pack(len(body)) + body)
+            (size,) = FRAME_HEADER.unpack(recv_exact(client, FRAME_HEADER.size))
+            reply = json.loads(recv_exact(client, size))
+    except (OSError, ValueError) as exc:
+        fail(f"Prover daemon request failed: {sock_path} ({exc})")
+    if not isinstance(reply, dict):
+        fail(f"Prover daemon returned an invalid reply: {sock_path}")
+    if not reply.get("ok"):
+        fail(f"Prover daemon failed: {reply.get('error') or 'unknown error'}")
+    return True
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser()
     parser.add_argument("--setup", action="store_true", help="Generate PK + VK")
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Load the PK once and serve prove requests on --sock",
+    )
+    parser.add_argument(
+        "--sock",
+        default=os.getenv("GARAGA_PROVER_SOCK", "").strip(),
+        help="Prover daemon unix socket (default: GARAGA_PROVER_SOCK)",
+    )
     parser.add_argument("--context", help="Path to context JSON")
     parser.add_argument("--proof", help="Output proof JSON path")
     parser.add_argument("--public-inputs", dest="public_inputs", help="Output public inputs JSON path")
+    parser.add_argument(
+        "--no-build",
+        dest="no_build",
+        action="store_true",
+        help="Never run cargo; use the existing release binary as-is",
+    )
     parser.add_argument(
         "--pk",
         default=os.getenv("GARAGA_PROVING_KEY_PATH", "").strip(),
@@ -74,18 +159,20 @@ def main() -> None:
     project_dir = Path(__file__).resolve().parent
     backend_dir = project_dir.parent
 
-    pk_path = (
-        Path(args.pk).expanduser().resolve()
-        if args.pk
-        else (backend_dir / "garaga_proving_key.bin").resolve()
-    )
-    vk_path = (
-        Path(args.vk).expanduser().resolve()
-        if args.vk
-        else (backend_dir / "garaga_vk.json").resolve()
-    )
+    pk_path = abs_path(args.pk) if args.pk else backend_dir / "garaga_proving_key.bin"
+    vk_path = abs_path(args.vk) if args.vk else backend_dir / "garaga_vk.json"
+
+    if not args.setup and not args.daemon:
+        context = abs_path(args.context) if args.context else None
+        proof_out = abs_path(args.proof) if args.proof else None
+        public_out = abs_path(args.public_inputs) if args.public_inputs else None
+        if proof_out is None or public_out is None:
+            fail("prove mode requires --proof and --public-inputs")
+        timeout_secs = int(os.getenv("GARAGA_REAL_PROVER_TIMEOUT_SECS", "180").strip() or "180")
+        if prove_via_daemon(args.sock, pk_path, context, proof_out, public_out, timeout_secs):
+            return
 
-    bin_path = ensure_binary(project_dir)
+    bin_path = ensure_binary(project_dir, no_build=args.no_build)
 
     if args.setup:
         sample_proof = backend_dir / "garaga_proof_raw.json"
@@ -109,14 +196,6 @@ def main() -> None:
         )
         return
 
-    context = Path(args.context).expanduser().resolve() if args.context else None
-    proof_out = Path(args.proof).expanduser().resolve() if args.proof else None
-    public_out = (
-        Path(args.public_inputs).expanduser().resolve() if args.public_inputs else None
-    )
-
-    if proof_out is None or public_out is None:
-        fail("prove mode requires --proof and --public-inputs")
     if not pk_path.is_file():
         fail(
             "Proving key not found.\n"
@@ -124,6 +203,14 @@ def main() -> None:
             "Run setup first: python3 backend-rust/garaga-real-prover/prove.py --setup"
         )
 
+    if args.daemon:
+        if not args.sock:
+            fail("daemon mode requires --sock or GARAGA_PROVER_SOCK")
+        os.execv(
+            str(bin_path),
+            [str(bin_path), "serve", "--pk", str(pk_path), "--sock", args.sock],
+        )
+
     cmd = [
         str(bin_path),
         "prove",
@@ -1,7 +1,14 @@
 use std::{
     fs::File,
-    io::Read,
+    io::{Read, Write},
+    os::unix::{
+        fs::PermissionsExt,
+        net::{UnixListener, UnixStream},
+    },
     path::{Path, PathBuf},
+    sync::Arc,
+    thread,
+    time::Duration,
 };
 
 use anyhow::{Context, Result, bail};
@@ -18,8 +25,8 @@ use ark_serialize::{CanonicalDeserialize, CanonicalSerialize};
 use clap::{Parser, Subcommand};
 use num_bigint::BigUint;
 use rand::{RngCore, rngs::OsRng};
-use serde::Serialize;
-use serde_json::Value;
+use serde::{Deserialize, Serialize};
+use serde_json::{Value, json};
 use sha2::{Digest, Sha256};
 
 const CIRCUIT_TAG: &[u8] = b"zkcare-garaga-note-spend-v3";
@@ -146,6 +153,38 @@ enum Command {
         #[arg(long)]
         context: Option<PathBuf>,
     },
+    /// Keep the proving key loaded and serve prove requests over a unix socket.
+    Serve {
+        /// Input proving key binary path.
+        #[arg(long)]
+        pk: PathBuf,
+        /// Unix socket path to listen on.
+        #[arg(long)]
+        sock: PathBuf,
+    },
+}
+
+/// Largest request frame the serve socket accepts; a prove request is a few paths.
+const MAX_FRAME_BYTES: usize = 64 * 1024;
+/// How long a connected client may take to send its request frame.
+const FRAME_READ_TIMEOUT: Duration = Duration::from_secs(30);
+
+/// One prove request on the serve socket (4-byte big-endian length + JSON body).
+#[derive(Debug, Deserialize)]
+struct ServeRequest {
+    proof_out: PathBuf,
+    public_inputs_out: PathBuf,
+    #[serde(default)]
+    context: Option<PathBuf>,
+    /// Proving key the caller expects; rejected when it is not the one this server loaded.
+    #[serde(default)]
+    pk: Option<PathBuf>,
+}
+
+/// Proving key loaded by `serve`, with its canonical path for request checks.
+struct ServedKey {
+    path: PathBuf,
+    key: ProvingKey<Bls12_381>,
 }
 
 #[derive(Debug, Serialize)]
@@ -202,6 +241,7 @@ fn main() -> Result<()> {
             public_inputs_out,
             context,
         } => run_prove(&pk, &proof_out, &public_inputs_out, context.as_deref()),
+        Command::Serve { pk, sock } => run_serve(&pk, &sock),
     }
 }
 
@@ -262,12 +302,109 @@ fn run_prove(
     public_inputs_out: &Path,
     context_path: Option<&Path>,
 ) -> Result<()> {
+    let proving_key = load_proving_key(pk_path)?;
+    run_prove_with_key(&proving_key, proof_out, public_inputs_out, context_path)
+}
+
+fn load_proving_key(pk_path: &Path) -> Result<ProvingKey<Bls12_381>> {
     let mut pk_file = File::open(pk_path)
         .with_context(|| format!("failed to open proving key file {}", pk_path.display()))?;
-    let proving_key = ProvingKey::<Bls12_381>::deserialize_uncompressed(&mut pk_file)
-        .with_context(|| format!("failed to deserialize proving key {}", pk_path.display()))?;
+    ProvingKey::<Bls12_381>::deserialize_uncompressed(&mut pk_file)
+        .with_context(|| format!("failed to deserialize proving key {}", pk_path.display()))
+}
 
-    run_prove_with_key(&proving_key, proof_out, public_inputs_out, context_path)
+// Deserializing the proving key dominates a warm `prove` call, so the server pays it once
+// and answers each connection with one proof on its own thread.
+fn run_serve(pk_path: &Path, sock_path: &Path) -> Result<()> {
+    let served = Arc::new(ServedKey {
+        path: pk_path
+            .canonicalize()
+            .with_context(|| format!("failed to resolve proving key path {}", pk_path.display()))?,
+        key: load_proving_key(pk_path)?,
+    });
+    ensure_parent(sock_path)?;
+    if sock_path.exists() {
+        std::fs::remove_file(sock_path)
+            .with_context(|| format!("failed to remove stale socket {}", sock_path.display()))?;
+    }
+    let listener = UnixListener::bind(sock_path)
+        .with_context(|| format!("failed to bind prover socket {}", sock_path.display()))?;
+    // Requests name output paths the server writes to: only the owning user may connect.
+    std::fs::set_permissions(sock_path, std::fs::Permissions::from_mode(0o600))
+        .with_context(|| format!("failed to restrict prover socket {}", sock_path.display()))?;
+    eprintln!("serving prove requests on {}", sock_path.display());
+
+    for stream in listener.incoming() {
+        let mut stream = match stream {
+            Ok(stream) => stream,
+            Err(err) => {
+                eprintln!("failed to accept prover connection: {err}");
+                continue;
+            }
+        };
+        let served = Arc::clone(&served);
+        thread::spawn(move || {
+            let reply = match serve_one(&served, &mut stream) {
+                Ok(()) => json!({ "ok": true }),
+                Err(err) => json!({ "ok": false, "error": format!("{err:#}") }),
+            };
+            if let Err(err) = write_frame(&mut stream, &reply) {
+                eprintln!("failed to send prover reply: {err:#}");
+            }
+        });
+    }
+    Ok(())
+}
+
+fn serve_one(served: &ServedKey, stream: &mut UnixStream) -> Result<()> {
+    stream
+        .set_read_timeout(Some(FRAME_READ_TIMEOUT))
+        .context("failed to set request read timeout")?;
+    let body = read_frame(stream)?;
+    let request: ServeRequest =
+        serde_json::from_slice(&body).context("invalid prove request JSON")?;
+    if let Some(pk) = &request.pk {
+        let requested = pk
+            .canonicalize()
+            .with_context(|| format!("failed to resolve requested proving key {}", pk.display()))?;
+        if requested != served.path {
+            bail!(
+                "prover daemon serves proving key {}, request expects {}",
+                served.path.display(),
+                requested.display()
+            );
+        }
+    }
+    run_prove_with_key(
+        &served.key,
+        &request.proof_out,
+        &request.public_inputs_out,
+        request.context.as_deref(),
+    )
+}
+
+fn read_frame(stream: &mut UnixStream) -> Result<Vec<u8>> {
+    let mut header = [0_u8; 4];
+    stream
+        .read_exact(&mut header)
+        .context("failed to read request frame header")?;
+    let len = u32::from_be_bytes(header) as usize;
+    if len > MAX_FRAME_BYTES {
+        bail!("request frame of {len} bytes exceeds limit of {MAX_FRAME_BYTES}");
+    }
+    let mut body = vec![0_u8; len];
+    stream
+        .read_exact(&mut body)
+        .context("failed to read request frame body")?;
+    Ok(body)
+}
+
+fn write_frame(stream: &mut UnixStream, value: &Value) -> Result<()> {
+    let body = serde_json::to_vec(value).context("failed to serialize reply frame")?;
+    let len = u32::try_from(body.len()).context("reply frame too large")?;
+    stream.write_all(&len.to_be_bytes())?;
+    stream.write_all(&body)?;
+    Ok(())
 }
 
 fn run_prove_with_key(
@@ -6,26 +6,99 @@ Modes:
 - default: bridge mode (stdin JSON -> stdout payload JSON)
 - --prove: execute real prover command that writes proof/public inputs files
 - --test: run two sample payloads and ensure proof is not static
+- --batch: stdin JSON array of requests -> stdout JSON array of payloads/errors,
+  proving up to GARAGA_MAX_PARALLEL requests concurrently
+- --daemon: newline-delimited JSON requests on stdin -> one payload/error JSON line
+  per request on stdout, until EOF
+
+Bridge mode forwards the request to a warm `prover_daemon.py` when
+GARAGA_DAEMON_SOCK points to a listening socket, and falls back to building the
+payload in-process otherwise.
 """
 
 from __future__ import annotations
 
-import argparse
-import ast
+import functools
 import hashlib
+import io
 import json
 import os
+import re
 import shlex
 import shutil
+import signal
+import struct
 import subprocess
 import sys
 import tempfile
+import threading
 import time
-from dataclasses import dataclass
+from itertools import repeat
 from pathlib import Path
-from typing import Mapping, NoReturn, NotRequired, TypedDict, cast
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Mapping,
+    NamedTuple,
+    NoReturn,
+    NotRequired,
+    TypedDict,
+    cast,
+)
+
+if TYPE_CHECKING:
+    import socket
+
+    import redis
+    from redis.commands.core import Script
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is used when orjson is not installed.
+    orjson = None  # type: ignore[assignment]
 
 STARKNET_PRIME = (1 << 251) + (17 << 192) + 1
+DAEMON_FRAME_HEADER = struct.Struct(">I")
+# Characters that need a real shell: operators, redirection, expansion, globbing, comments.
+SHELL_META_CHARS = frozenset("|&;<>()$`\\*?[]{}~!#\n")
+# Accepted spellings of the Groth16 A/B/C points (plain a/b/c, snarkjs pi_*, gnark Ar/Bs/Krs).
+GROTH16_PROOF_A_KEYS = frozenset({"a", "pi_a", "ar"})
+GROTH16_PROOF_B_KEYS = frozenset({"b", "pi_b", "bs"})
+GROTH16_PROOF_C_KEYS = frozenset({"c", "pi_c", "krs"})
+CALLDATA_ARRAY_RE = re.compile(r"\[[\s0-9a-fA-FxX,'\"-]*\]")
+WIDE_JSON_INT_RE = re.compile(rb"(?:^|[\[,:])\s*-?\d{19}")
+# KEYS[1]=slot counter, ARGV[1]=max concurrent, ARGV[2]=slot TTL. Returns the slot number, or
+# 0 when the queue is full (the increment is undone atomically).
+QUEUE_ACQUIRE_LUA = """
+local current = redis.call('INCR', KEYS[1])
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+if current > tonumber(ARGV[1]) then
+  redis.call('DECR', KEYS[1])
+  return 0
+end
+return current
+"""
+# KEYS[2]=wakeup list: each release pushes one token so a waiter blocked in BLPOP retries
+# immediately. Bounded and expiring, so stale tokens only cause a cheap extra attempt.
+QUEUE_RELEASE_LUA = """
+local current = redis.call('DECR', KEYS[1])
+if current <= 0 then
+  redis.call('DEL', KEYS[1])
+end
+redis.call('RPUSH', KEYS[2], '1')
+redis.call('LTRIM', KEYS[2], -64, -1)
+redis.call('EXPIRE', KEYS[2], 60)
+return current
+"""
+QUEUE_WAKEUP_SUFFIX = ":wakeup"
+# Upper bound on one BLPOP wait, so slots freed by TTL expiry (crashed holders) are still seen.
+QUEUE_WAKEUP_MAX_WAIT_SECS = 1
+# Byte-for-byte `json.dumps(tx_context, sort_keys=True)` (the intent-hash preimage format),
+# built once; json.dumps constructs a fresh encoder per call whenever options are passed.
+INTENT_CONTEXT_ENCODER = json.JSONEncoder(sort_keys=True)
+REDIS_CLIENTS: dict[str, RedisQueueClient] = {}
+REDIS_CLIENTS_LOCK = threading.Lock()
+CALLDATA_WORKER_SCRIPT = Path(__file__).with_name("garaga_calldata_worker.py")
 
 
 class GaragaPayload(TypedDict):
@@ -43,16 +116,27 @@ class GaragaPayload(TypedDict):
     vk_n_public: NotRequired[int]
 
 
+class ProverError(SystemExit):
+    """SystemExit raised by `fail`, keeping the message for in-process callers."""
+
+    def __init__(self, message: str, code: int = 1) -> None:
+        super().__init__(code)
+        self.message = message
+
+
 def fail(message: str, code: int = 1) -> NoReturn:
     print(message, file=sys.stderr)
-    raise SystemExit(code)
+    raise ProverError(message, code)
 
 
 def warn(message: str) -> None:
     print(f"[garaga-auto-prover] {message}", file=sys.stderr)
 
 
+@functools.lru_cache(maxsize=None)
 def getenv_clean(name: str, default: str = "") -> str:
+    # The bridge never mutates os.environ, so each (name, default) is resolved once per process;
+    # build_payload alone reads ~15 settings per request.
     value = os.getenv(name, default).strip()
     if len(value) >= 2 and value[0] == value[-1] and value[0] in {"'", '"'}:
         return value[1:-1].strip()
@@ -66,6 +150,27 @@ def getenv_required(name: str) -> str:
     return value
 
 
+def json_loads(data: bytes | str) -> object:
+    if orjson is not None:
+        raw = data.encode("utf-8") if isinstance(data, str) else data
+        # orjson turns integers wider than 64 bits into floats; felts need exact ints.
+        if WIDE_JSON_INT_RE.search(raw) is None:
+            try:
+                return orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                pass
+    return json.loads(data)
+
+
+def json_dumps_bytes(value: object) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(value)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(value).encode("utf-8")
+
+
 def clean_optional_text(value: object) -> str:
     if value is None:
         return ""
@@ -77,40 +182,243 @@ def clean_optional_text(value: object) -> str:
     return text
 
 
+def read_stdin_bytes() -> bytes:
+    # Raw bytes go straight to orjson; skips the text-layer decode of the whole payload.
+    buffer = getattr(sys.stdin, "buffer", None)
+    if buffer is None:
+        return sys.stdin.read().encode("utf-8").strip()
+    return buffer.read().strip()
+
+
 def parse_stdin_payload() -> dict[str, object]:
-    raw = sys.stdin.read().strip()
+    raw = read_stdin_bytes()
     if not raw:
         return {}
     try:
-        value: object = json.loads(raw)
-    except json.JSONDecodeError as exc:
+        value: object = json_loads(raw)
+    except (json.JSONDecodeError, UnicodeDecodeError) as exc:
         fail(f"Invalid stdin JSON: {exc}")
     if not isinstance(value, dict):
         fail("stdin JSON must be an object")
     return cast(dict[str, object], value)
 
 
-def run_shell(
+def write_json_stdout(value: object) -> None:
+    # One write of already-encoded bytes; falls back to text stdout when it has no buffer.
+    body = json_dumps_bytes(value)
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        sys.stdout.write(body.decode("utf-8"))
+        return
+    sys.stdout.flush()
+    buffer.write(body)
+    buffer.flush()
+
+
+def send_frame(sock: socket.socket, value: object) -> None:
+    body = json_dumps_bytes(value)
+    sock.sendall(DAEMON_FRAME_HEADER.pack(len(body)) + body)
+
+
+def recv_frame(sock: socket.socket) -> object:
+    def recv_exact(size: int) -> bytes:
+        chunks: list[bytes] = []
+        while size > 0:
+            chunk = sock.recv(size)
+            if not chunk:
+                raise ConnectionError("prover daemon connection closed mid-frame")
+            chunks.append(chunk)
+            size -= len(chunk)
+        return b"".join(chunks)
+
+    (size,) = DAEMON_FRAME_HEADER.unpack(recv_exact(DAEMON_FRAME_HEADER.size))
+    return json_loads(recv_exact(size))
+
+
+def request_prover_daemon(
+    sock_path: str,
+    stdin_payload: Mapping[str, object],
+    timeout_secs: int,
+) -> GaragaPayload | None:
+    if not os.path.exists(sock_path):
+        return None
+    import socket
+
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    client.settimeout(timeout_secs)
+    try:
+        try:
+            client.connect(sock_path)
+        except OSError as exc:
+            warn(f"Prover daemon unavailable at {sock_path} ({exc}); building payload in-process.")
+            return None
+        try:
+            send_frame(client, {"ctx": stdin_payload})
+            reply = recv_frame(client)
+        except (OSError, ValueError) as exc:
+            fail(f"Prover daemon request failed: {sock_path} ({exc})")
+    finally:
+        client.close()
+    if not isinstance(reply, dict):
+        fail("Prover daemon returned an invalid reply frame")
+    if not reply.get("ok"):
+        fail(str(reply.get("error") or "Prover daemon returned an unknown error"))
+    payload = reply.get("payload")
+    if not isinstance(payload, dict):
+        fail("Prover daemon reply does not contain a payload object")
+    return cast(GaragaPayload, payload)
+
+
+def parse_stdin_batch() -> list[dict[str, object]]:
+    raw = read_stdin_bytes()
+    if not raw:
+        return []
+    try:
+        value: object = json_loads(raw)
+    except (json.JSONDecodeError, UnicodeDecodeError) as exc:
+        fail(f"Invalid stdin JSON: {exc}")
+    if not isinstance(value, list) or not all(isinstance(item, dict) for item in value):
+        fail("stdin JSON must be an array of objects in --batch mode")
+    return cast(list[dict[str, object]], value)
+
+
+def split_plain_command(command: str) -> list[str] | None:
+    if any(ch in SHELL_META_CHARS for ch in command):
+        return None
+    try:
+        return shlex.split(command)
+    except ValueError:
+        return None
+
+
+def direct_argv(command: str, argv: list[str] | None = None) -> list[str] | None:
+    # Plain commands are exec'd directly, skipping login-shell start-up; anything that needs
+    # shell features (or GARAGA_USE_SHELL=1) still runs through shell_argv.
+    if bool_env("GARAGA_USE_SHELL", False):
+        return None
+    if argv is None:
+        argv = split_plain_command(command)
+    if not argv or "=" in argv[0] or shutil.which(argv[0]) is None:
+        return None
+    return argv
+
+
+def shell_argv(command: str) -> list[str]:
+    # Non-login `bash -c` skips profile loading but keeps bash syntax (`source`, `[[ ]]`,
+    # pipefail); GARAGA_LOGIN_SHELL=1 restores `bash -lc` for setups that rely on the login
+    # profile (e.g. PATH entries added in ~/.profile).
+    if bool_env("GARAGA_LOGIN_SHELL", False):
+        return ["bash", "-lc", command]
+    return ["bash", "-c", command]
+
+
+def spawn_shell(
     command: str,
     timeout_secs: int,
     extra_env: dict[str, str] | None = None,
+    argv: list[str] | None = None,
 ) -> subprocess.CompletedProcess[str]:
-    env = os.environ.copy()
-    if extra_env:
-        env.update(extra_env)
+    # env=None inherits the parent environment without cloning it; only overlay when needed.
+    env = {**os.environ, **extra_env} if extra_env else None
     try:
-        return subprocess.run(
-            ["bash", "-lc", command],
+        # Own session, so a timeout can kill the whole group: under `bash -c` the prover is a
+        # grandchild that would otherwise outlive the shell and keep writing its outputs.
+        proc = subprocess.Popen(
+            direct_argv(command, argv) or shell_argv(command),
             text=True,
-            capture_output=True,
-            timeout=timeout_secs,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
             env=env,
-            check=False,
+            start_new_session=True,
         )
-    except subprocess.TimeoutExpired as exc:
-        fail(f"Command timeout ({timeout_secs}s): {command}\n{exc}")
     except OSError as exc:
         fail(f"Failed to run command: {command}\n{exc}")
+    try:
+        stdout, stderr = proc.communicate(timeout=timeout_secs)
+    except BaseException:
+        kill_process_group(proc)
+        proc.communicate()
+        raise
+    return subprocess.CompletedProcess(proc.args, proc.returncode, stdout, stderr)
+
+
+def kill_process_group(proc: subprocess.Popen[str] | subprocess.Popen[bytes]) -> None:
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except OSError:
+        # Group already gone; make sure the direct child is not left running either.
+        if proc.poll() is None:
+            proc.kill()
+
+
+def run_shell(
+    command: str,
+    timeout_secs: int,
+    extra_env: dict[str, str] | None = None,
+    argv: list[str] | None = None,
+) -> subprocess.CompletedProcess[str]:
+    try:
+        return spawn_shell(command, timeout_secs, extra_env, argv)
+    except subprocess.TimeoutExpired as exc:
+        fail(f"Command timeout ({timeout_secs}s): {command}\n{exc}")
+
+
+def timeout_max_factor() -> int:
+    # Default 1: a single attempt, as the caller (backend auto-submit) has its own deadline.
+    return max(int(getenv_clean("GARAGA_TIMEOUT_MAX_FACTOR", "1") or "1"), 1)
+
+
+def timeout_budget_secs() -> int:
+    # Total wall-clock cap across all doubling attempts of one command; 0 means uncapped.
+    return max(int(getenv_clean("GARAGA_TIMEOUT_BUDGET_SECS", "0") or "0"), 0)
+
+
+def doubling_timeout_budget(timeout_secs: int, max_factor: int) -> int:
+    total = 0
+    attempt_timeout = timeout_secs
+    while attempt_timeout <= timeout_secs * max_factor:
+        total += attempt_timeout
+        attempt_timeout *= 2
+    budget = timeout_budget_secs()
+    return min(total, budget) if budget else total
+
+
+def run_shell_with_doubling(
+    command: str,
+    timeout_secs: int,
+    extra_env: dict[str, str] | None = None,
+    max_factor: int | None = None,
+    argv: list[str] | None = None,
+    attempt_env: Callable[[int], dict[str, str]] | None = None,
+) -> tuple[subprocess.CompletedProcess[str], int]:
+    # Opt-in (GARAGA_TIMEOUT_MAX_FACTOR > 1): retry slow runs with T, 2T, 4T, ... up to
+    # max_factor*T, never past GARAGA_TIMEOUT_BUDGET_SECS in total. attempt_env(n) adds
+    # per-attempt env (e.g. a fresh output dir); returns the result and its attempt index.
+    limit_secs = timeout_secs * (timeout_max_factor() if max_factor is None else max(max_factor, 1))
+    budget = timeout_budget_secs()
+    deadline = time.monotonic() + budget if budget else None
+    attempt_timeout = timeout_secs
+    attempt = 0
+    while True:
+        run_timeout = attempt_timeout
+        if deadline is not None:
+            run_timeout = max(min(run_timeout, int(deadline - time.monotonic())), 1)
+        env = extra_env
+        if attempt_env is not None:
+            env = {**(extra_env or {}), **attempt_env(attempt)}
+        try:
+            return spawn_shell(command, run_timeout, env, argv), attempt
+        except subprocess.TimeoutExpired as exc:
+            next_timeout = attempt_timeout * 2
+            out_of_budget = deadline is not None and deadline - time.monotonic() < 1
+            if next_timeout > limit_secs or out_of_budget:
+                fail(f"Command timeout ({run_timeout}s): {command}\n{exc}")
+            warn(
+                f"Command timed out after {run_timeout}s; retrying with "
+                f"{next_timeout}s timeout: {command}"
+            )
+            attempt_timeout = next_timeout
+            attempt += 1
 
 
 def to_hex_felt(value: object) -> str:
@@ -119,7 +427,7 @@ def to_hex_felt(value: object) -> str:
         raw = value.strip()
         if not raw:
             fail("Empty felt string encountered")
-        if raw.lower().startswith("0x"):
+        if raw[:2] in ("0x", "0X"):
             intval = int(raw, 16)
         else:
             intval = int(raw, 10)
@@ -127,18 +435,84 @@ def to_hex_felt(value: object) -> str:
         intval = value
     else:
         fail(f"Unsupported felt type: {type(value).__name__}")
-    intval %= STARKNET_PRIME
+    # Garaga and prover outputs are already field elements; only reduce when out of range.
+    if not 0 <= intval < STARKNET_PRIME:
+        intval %= STARKNET_PRIME
     return hex(intval)
 
 
-def parse_json_array_file(path: Path, expected_key: str | None = None) -> list[str]:
-    if not path.exists():
+def to_hex_felts(values: list[object]) -> list[str]:
+    # Batch form of to_hex_felt: one pass, type dispatch by identity, prime bound locally.
+    prime = STARKNET_PRIME
+    # Calldata and most prover outputs are homogeneous ints: specialize to one comprehension.
+    if values and type(values[0]) is int and set(map(type, values)) == {int}:
+        return [
+            hex(value) if 0 <= value < prime else hex(value % prime)
+            for value in cast(list[int], values)
+        ]
+    # Prover JSON files are homogeneous "0x..." strings: parse them with one C-level map.
+    if (
+        values
+        and type(values[0]) is str
+        and set(map(type, values)) == {str}
+        and all(map(str.startswith, cast(list[str], values), repeat("0x")))
+    ):
+        return [
+            hex(intval) if 0 <= intval < prime else hex(intval % prime)
+            for intval in map(int, cast(list[str], values), repeat(16))
+        ]
+    felts: list[str] = []
+    append = felts.append
+    for value in values:
+        kind = type(value)
+        if kind is int:
+            intval = cast(int, value)
+        elif kind is str:
+            raw = cast(str, value).strip()
+            if raw[:2] in ("0x", "0X"):
+                intval = int(raw, 16)
+            elif raw:
+                intval = int(raw, 10)
+            else:
+                fail("Empty felt string encountered")
+        else:
+            append(to_hex_felt(value))
+            continue
+        append(hex(intval) if 0 <= intval < prime else hex(intval % prime))
+    return felts
+
+
+def read_file_bytes(path: Path) -> bytes:
+    # Unbuffered raw read into a single bytes object; JSON is parsed from bytes with no
+    # text decode step in between.
+    with io.FileIO(path, "r") as handle:
+        return handle.readall()
+
+
+@functools.lru_cache(maxsize=32)
+def load_json_snapshot(path: str, mtime_ns: int, size: int, inode: int) -> object:
+    # Keyed by stat identity: a rewritten or replaced file misses and is parsed afresh, while
+    # repeat reads of an unchanged file (static proof paths, validate-then-parse) reuse it.
+    # Callers must treat the returned object as read-only.
+    return json_loads(read_file_bytes(Path(path)))
+
+
+def load_json_file(path: Path) -> object:
+    try:
+        stat = path.stat()
+    except OSError:
         fail(f"File not found: {path}")
     try:
-        obj: object = json.loads(path.read_text())
+        return load_json_snapshot(str(path), stat.st_mtime_ns, stat.st_size, stat.st_ino)
     except json.JSONDecodeError as exc:
         fail(f"Invalid JSON in {path}: {exc}")
 
+
+def parse_json_array_file(path: Path, expected_key: str | None = None) -> list[str]:
+    return extract_felt_array(load_json_file(path), path, expected_key)
+
+
+def extract_felt_array(obj: object, path: Path, expected_key: str | None = None) -> list[str]:
     payload: object
     if isinstance(obj, list):
         payload = obj
@@ -157,26 +531,22 @@ def parse_json_array_file(path: Path, expected_key: str | None = None) -> list[s
 
     if not isinstance(payload, list) or not payload:
         fail(f"Array in {path} is empty or invalid")
-    return [to_hex_felt(item) for item in payload]
+    return to_hex_felts(payload)
 
 
 def _looks_like_groth16_proof_dict(value: object) -> bool:
     if not isinstance(value, dict):
         return False
     keys = {str(key).strip().lower() for key in value}
-    has_a = "a" in keys or "pi_a" in keys or "ar" in keys
-    has_b = "b" in keys or "pi_b" in keys or "bs" in keys
-    has_c = "c" in keys or "pi_c" in keys or "krs" in keys
-    return has_a and has_b and has_c
+    return (
+        not keys.isdisjoint(GROTH16_PROOF_A_KEYS)
+        and not keys.isdisjoint(GROTH16_PROOF_B_KEYS)
+        and not keys.isdisjoint(GROTH16_PROOF_C_KEYS)
+    )
 
 
 def validate_proof_json_file(path: Path) -> None:
-    if not path.exists():
-        fail(f"File not found: {path}")
-    try:
-        obj: object = json.loads(path.read_text())
-    except json.JSONDecodeError as exc:
-        fail(f"Invalid JSON in {path}: {exc}")
+    obj = load_json_file(path)
 
     # Legacy bridge format: direct array or object field that already contains felt array.
     if isinstance(obj, list) and obj:
@@ -197,6 +567,7 @@ def validate_proof_json_file(path: Path) -> None:
     )
 
 
+@functools.lru_cache(maxsize=None)
 def parse_index(name: str, default: int) -> int:
     raw = getenv_clean(name, str(default))
     try:
@@ -208,9 +579,22 @@ def parse_index(name: str, default: int) -> int:
     return parsed
 
 
-def bind_nullifier_commitment_from_public_inputs(public_inputs: list[str]) -> tuple[str, str]:
-    nullifier_idx = parse_index("GARAGA_NULLIFIER_PUBLIC_INPUT_INDEX", 0)
-    commitment_idx = parse_index("GARAGA_COMMITMENT_PUBLIC_INPUT_INDEX", 1)
+@functools.lru_cache(maxsize=1)
+def binding_indices() -> tuple[int, int]:
+    # Env is fixed for the life of the process (bridge, batch or daemon), so parse once.
+    return (
+        parse_index("GARAGA_NULLIFIER_PUBLIC_INPUT_INDEX", 0),
+        parse_index("GARAGA_COMMITMENT_PUBLIC_INPUT_INDEX", 1),
+    )
+
+
+def bind_nullifier_commitment_from_public_inputs(
+    public_inputs: list[str],
+    nullifier_idx: int | None = None,
+    commitment_idx: int | None = None,
+) -> tuple[str, str]:
+    if nullifier_idx is None or commitment_idx is None:
+        nullifier_idx, commitment_idx = binding_indices()
     required_len = max(nullifier_idx, commitment_idx) + 1
     if len(public_inputs) < required_len:
         fail(
@@ -218,11 +602,11 @@ def bind_nullifier_commitment_from_public_inputs(public_inputs: list[str]) -> tu
             f"len={len(public_inputs)}, required>={required_len}, "
             f"nullifier_idx={nullifier_idx}, commitment_idx={commitment_idx}"
         )
-    nullifier = to_hex_felt(public_inputs[nullifier_idx])
-    commitment = to_hex_felt(public_inputs[commitment_idx])
-    return nullifier, commitment
+    # public_inputs are canonical felt hex from to_hex_felts, so no re-normalization here.
+    return public_inputs[nullifier_idx], public_inputs[commitment_idx]
 
 
+@functools.lru_cache(maxsize=None)
 def bool_env(name: str, default: bool = False) -> bool:
     raw = getenv_clean(name).lower()
     if not raw:
@@ -230,6 +614,14 @@ def bool_env(name: str, default: bool = False) -> bool:
     return raw in {"1", "true", "yes", "on"}
 
 
+def clear_env_caches() -> None:
+    # For in-process callers that change os.environ between build_payload calls.
+    getenv_clean.cache_clear()
+    parse_index.cache_clear()
+    binding_indices.cache_clear()
+    bool_env.cache_clear()
+
+
 def _tx_field(tx_context: Mapping[str, object], *keys: str) -> str:
     for key in keys:
         text = clean_optional_text(tx_context.get(key))
@@ -238,6 +630,10 @@ def _tx_field(tx_context: Mapping[str, object], *keys: str) -> str:
     return ""
 
 
+def digest_to_felt(digest: bytes) -> str:
+    return hex(int.from_bytes(digest, byteorder="big") % STARKNET_PRIME)
+
+
 def compute_intent_hash(stdin_payload: Mapping[str, object]) -> tuple[str, str]:
     tx_context_raw = stdin_payload.get("tx_context")
     tx_context: dict[str, object]
@@ -277,10 +673,11 @@ def compute_intent_hash(stdin_payload: Mapping[str, object]) -> tuple[str, str]:
             pool = token
         preimage = [user_address, token, _tx_field(tx_context, "amount"), pool, nonce]
     else:
-        preimage = [user_address, json.dumps(tx_context, sort_keys=True), nonce]
+        preimage = [user_address, INTENT_CONTEXT_ENCODER.encode(tx_context), nonce]
 
+    # One join + encode beats per-field hasher.update() calls for these few short fields.
     digest = hashlib.sha256("|".join(preimage).encode("utf-8")).digest()
-    intent_hash = to_hex_felt(int.from_bytes(digest, byteorder="big"))
+    intent_hash = digest_to_felt(digest)
     return intent_hash, nonce
 
 
@@ -291,11 +688,15 @@ def make_dynamic_binding(
 ) -> tuple[str, str]:
     requested_at = str(stdin_payload.get("requested_at_unix", "")).strip()
     seed = f"{intent_hash}|{nonce}|{requested_at}|{stdin_payload.get('verifier', '')}"
-    raw = seed.encode("utf-8")
-    nullifier_hash = hashlib.sha256(raw + b":nullifier").digest()
-    commitment_hash = hashlib.sha256(raw + b":commitment").digest()
-    nullifier = to_hex_felt(int.from_bytes(nullifier_hash, byteorder="big"))
-    commitment = to_hex_felt(int.from_bytes(commitment_hash, byteorder="big"))
+    # Both digests share the seed prefix: hash it once and fork the state per suffix.
+    base = hashlib.sha256(seed.encode("utf-8"))
+    nullifier_state = base.copy()
+    nullifier_state.update(b":nullifier")
+    base.update(b":commitment")
+    nullifier_hash = nullifier_state.digest()
+    commitment_hash = base.digest()
+    nullifier = digest_to_felt(nullifier_hash)
+    commitment = digest_to_felt(commitment_hash)
     return nullifier, commitment
 
 
@@ -303,27 +704,51 @@ def apply_binding_to_public_inputs(
     public_inputs: list[str],
     nullifier: str,
     commitment: str,
+    nullifier_idx: int | None = None,
+    commitment_idx: int | None = None,
 ) -> list[str]:
-    nullifier_idx = parse_index("GARAGA_NULLIFIER_PUBLIC_INPUT_INDEX", 0)
-    commitment_idx = parse_index("GARAGA_COMMITMENT_PUBLIC_INPUT_INDEX", 1)
+    if nullifier_idx is None or commitment_idx is None:
+        nullifier_idx, commitment_idx = binding_indices()
     required_len = max(nullifier_idx, commitment_idx) + 1
-    while len(public_inputs) < required_len:
-        public_inputs.append("0x0")
-    public_inputs[nullifier_idx] = to_hex_felt(nullifier)
-    public_inputs[commitment_idx] = to_hex_felt(commitment)
+    if len(public_inputs) < required_len:
+        public_inputs.extend(["0x0"] * (required_len - len(public_inputs)))
+    # nullifier/commitment come from make_dynamic_binding already reduced to felts.
+    public_inputs[nullifier_idx] = nullifier
+    public_inputs[commitment_idx] = commitment
     return public_inputs
 
 
-@dataclass
+class RedisQueueClient(NamedTuple):
+    # Pooled client plus the queue scripts registered on it; each script call is an EVALSHA
+    # (redis-py reloads the body itself after a server-side SCRIPT FLUSH).
+    client: redis.Redis
+    acquire: Script
+    release: Script
+    error: type[Exception]
+
+
 class RedisQueueLease:
-    redis_url: str
-    key: str
-    acquired: bool = False
+    __slots__ = ("redis_url", "key", "acquired", "client")
+
+    def __init__(
+        self,
+        redis_url: str,
+        key: str,
+        acquired: bool = False,
+        client: RedisQueueClient | None = None,
+    ) -> None:
+        self.redis_url = redis_url
+        self.key = key
+        self.acquired = acquired
+        self.client = client
 
     def release(self) -> None:
         if not self.acquired or not self.redis_url or not self.key:
             return
         try:
+            if self.client is not None:
+                self.client.release(keys=[self.key, self.key + QUEUE_WAKEUP_SUFFIX])
+                return
             current_raw = redis_cli(self.redis_url, ["DECR", self.key], hard_fail=False)
             if not current_raw:
                 return
@@ -335,6 +760,80 @@ class RedisQueueLease:
             pass
 
 
+def redis_client(redis_url: str) -> RedisQueueClient | None:
+    # One pooled redis-py client per URL for the life of the process (batch/daemon reuse it).
+    # redis-py is imported here rather than at module load: it pulls in asyncio, which every
+    # per-request bridge spawn would otherwise pay even with no queue configured.
+    try:
+        import redis
+    except ImportError:  # Optional; the queue falls back to one `redis-cli` process per command.
+        return None
+    with REDIS_CLIENTS_LOCK:
+        client = REDIS_CLIENTS.get(redis_url)
+        if client is None:
+            try:
+                conn = redis.Redis.from_url(
+                    redis_url,
+                    socket_timeout=5,
+                    socket_connect_timeout=5,
+                    decode_responses=True,
+                )
+            except ValueError as exc:
+                warn(f"Invalid Redis URL for redis-py, using redis-cli: {exc}")
+                return None
+            client = RedisQueueClient(
+                client=conn,
+                acquire=conn.register_script(QUEUE_ACQUIRE_LUA),
+                release=conn.register_script(QUEUE_RELEASE_LUA),
+                error=redis.RedisError,
+            )
+            REDIS_CLIENTS[redis_url] = client
+    return client
+
+
+def acquire_queue_slot_with_client(
+    client: RedisQueueClient,
+    redis_url: str,
+    key: str,
+    max_concurrent: int,
+    slot_ttl_secs: int,
+    queue_timeout_secs: int,
+    fail_open: bool,
+) -> RedisQueueLease:
+    deadline = time.monotonic() + queue_timeout_secs
+    while True:
+        try:
+            current = int(
+                client.acquire(keys=[key], args=[max_concurrent, slot_ttl_secs])
+            )
+        except (client.error, ValueError, TypeError) as exc:
+            if fail_open:
+                warn(f"Redis queue unavailable ({exc}); continuing prover without queue lock.")
+                return RedisQueueLease(redis_url="", key="", acquired=False)
+            fail(f"Redis queue command failed: {exc}")
+        if current > 0:
+            return RedisQueueLease(redis_url=redis_url, key=key, acquired=True, client=client)
+        if time.monotonic() >= deadline:
+            if fail_open:
+                warn(
+                    "Garaga prover queue timeout after "
+                    f"{queue_timeout_secs}s (max concurrent={max_concurrent}); "
+                    "continuing prover without queue lock."
+                )
+                return RedisQueueLease(redis_url="", key="", acquired=False)
+            fail(
+                "Garaga prover queue timeout after "
+                f"{queue_timeout_secs}s (max concurrent={max_concurrent})."
+            )
+        wait_secs = min(
+            QUEUE_WAKEUP_MAX_WAIT_SECS, max(int(deadline - time.monotonic()), 1)
+        )
+        try:
+            client.client.blpop([key + QUEUE_WAKEUP_SUFFIX], timeout=wait_secs)
+        except client.error:
+            time.sleep(0.2)
+
+
 def redis_cli(
     redis_url: str,
     args: list[str],
@@ -399,6 +898,18 @@ def acquire_prover_queue_slot(job_timeout_secs: int) -> RedisQueueLease:
     )
     key = getenv_clean("GARAGA_PROVER_QUEUE_KEY", "garaga:prover:active") or "garaga:prover:active"
 
+    client = redis_client(redis_url)
+    if client is not None:
+        return acquire_queue_slot_with_client(
+            client,
+            redis_url,
+            key,
+            max_concurrent,
+            slot_ttl_secs,
+            queue_timeout_secs,
+            fail_open,
+        )
+
     lease = RedisQueueLease(redis_url=redis_url, key=key, acquired=False)
     deadline = time.monotonic() + queue_timeout_secs
 
@@ -464,18 +975,24 @@ def maybe_run_external_prover(
     proof_path: Path,
     public_inputs_path: Path | None,
     timeout_secs: int,
+    context_path: Path,
 ) -> None:
     if not prove_cmd:
         return
 
     output_dir.mkdir(parents=True, exist_ok=True)
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as tmp:
-        json.dump(stdin_payload, tmp)
-        tmp.flush()
-        context_path = tmp.name
+    # Lives in the per-request temp dir, so it is removed with the prover outputs. Written with a
+    # single raw os.write: no buffered file object, owner-only since it carries request data.
+    fd = os.open(context_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    try:
+        pending = memoryview(json_dumps_bytes(stdin_payload))
+        while pending:
+            pending = pending[os.write(fd, pending) :]
+    finally:
+        os.close(fd)
 
     extra_env = {
-        "GARAGA_CONTEXT_PATH": context_path,
+        "GARAGA_CONTEXT_PATH": str(context_path),
         "GARAGA_OUTPUT_DIR": str(output_dir),
         "GARAGA_PROOF_PATH": str(proof_path),
         "GARAGA_QUEUE_SKIP": "1",
@@ -485,9 +1002,28 @@ def maybe_run_external_prover(
 
     lease: RedisQueueLease | None = None
     if not bool_env("GARAGA_QUEUE_SKIP", False):
-        lease = acquire_prover_queue_slot(job_timeout_secs=timeout_secs)
+        lease = acquire_prover_queue_slot(
+            job_timeout_secs=doubling_timeout_budget(timeout_secs, timeout_max_factor())
+        )
+    def attempt_env(attempt: int) -> dict[str, str]:
+        # Retries write into their own directory: a killed attempt can never race the next
+        # one on the same output files.
+        if attempt == 0:
+            return {}
+        attempt_dir = proof_path.parent / f"attempt-{attempt}"
+        attempt_dir.mkdir(parents=True, exist_ok=True)
+        env = {
+            "GARAGA_OUTPUT_DIR": str(attempt_dir),
+            "GARAGA_PROOF_PATH": str(attempt_dir / proof_path.name),
+        }
+        if public_inputs_path:
+            env["GARAGA_PUBLIC_INPUTS_PATH"] = str(attempt_dir / public_inputs_path.name)
+        return env
+
     try:
-        result = run_shell(prove_cmd, timeout_secs=timeout_secs, extra_env=extra_env)
+        result, attempt = run_shell_with_doubling(
+            prove_cmd, timeout_secs=timeout_secs, extra_env=extra_env, attempt_env=attempt_env
+        )
     finally:
         if lease is not None:
             lease.release()
@@ -499,6 +1035,212 @@ def maybe_run_external_prover(
             f"stdout:\n{result.stdout}\n"
             f"stderr:\n{result.stderr}"
         )
+    if attempt:
+        # Move the winning attempt's outputs to the paths the caller reads.
+        attempt_dir = proof_path.parent / f"attempt-{attempt}"
+        for target in (proof_path, public_inputs_path):
+            if target is not None and (attempt_dir / target.name).exists():
+                os.replace(attempt_dir / target.name, target)
+
+
+@functools.lru_cache(maxsize=None)
+def load_garaga_groth16_calldata() -> Callable[[Path, Path, Path | None], list[int]] | None:
+    try:
+        from garaga.starknet.groth16_contract_generator.calldata import (  # type: ignore[import-not-found]
+            groth16_calldata_from_vk_and_proof,
+        )
+        from garaga.starknet.groth16_contract_generator.parsing_utils import (  # type: ignore[import-not-found]
+            Groth16Proof,
+            Groth16VerifyingKey,
+        )
+    except ImportError:
+        return None
+
+    def calldata(vk_path: Path, proof_path: Path, public_inputs_path: Path | None) -> list[int]:
+        vk = Groth16VerifyingKey.from_json(vk_path)
+        proof = Groth16Proof.from_json(proof_path, public_inputs_path)
+        return list(groth16_calldata_from_vk_and_proof(vk, proof))
+
+    return calldata
+
+
+def garaga_calldata_in_process(
+    system: str,
+    vk_path: Path,
+    proof_path: Path,
+    public_inputs_path: Path | None,
+) -> list[int] | None:
+    # Same values `garaga calldata --format array` prints, without a uvx/interpreter launch.
+    if system != "groth16" or bool_env("GARAGA_FORCE_CLI", False):
+        return None
+    calldata = load_garaga_groth16_calldata()
+    if calldata is None:
+        return None
+    try:
+        return calldata(vk_path, proof_path, public_inputs_path)
+    except Exception as exc:  # noqa: BLE001
+        warn(f"In-process garaga calldata failed ({exc}); falling back to garaga CLI.")
+        return None
+
+
+def start_uvx_warmup(uvx_cmd: str, system: str) -> subprocess.Popen[bytes] | None:
+    # Resolve the uvx garaga environment in the background while the external prover runs, so
+    # the `garaga calldata` call that follows skips uvx cold start on the critical path.
+    if not bool_env("GARAGA_UVX_PREWARM", True) or GARAGA_WORKER.alive():
+        return None
+    if (
+        system == "groth16"
+        and not bool_env("GARAGA_FORCE_CLI", False)
+        and load_garaga_groth16_calldata() is not None
+    ):
+        return None
+    command = f"{uvx_cmd} garaga --help"
+    try:
+        return subprocess.Popen(
+            direct_argv(command) or shell_argv(command),
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    except OSError as exc:
+        warn(f"uvx warmup failed to start (ignored): {exc}")
+        return None
+
+
+def finish_uvx_warmup(proc: subprocess.Popen[bytes] | None) -> None:
+    if proc is None:
+        return
+    kill_process_group(proc)
+    proc.wait()
+
+
+class GaragaWorker:
+    # One warm garaga_calldata_worker.py for long-lived modes (batch, daemon), so uvx
+    # resolution and the garaga import are paid once instead of per `garaga calldata` run.
+    # Any worker failure disables it and the caller falls back to the CLI.
+    def __init__(self) -> None:
+        self.enabled = False
+        self.proc: subprocess.Popen[bytes] | None = None
+        self.pending = bytearray()
+        self.lock = threading.Lock()
+
+    def enable(self) -> None:
+        self.enabled = bool_env("GARAGA_CALLDATA_WORKER", True)
+
+    def alive(self) -> bool:
+        return self.proc is not None and self.proc.poll() is None
+
+    def stop(self) -> None:
+        proc, self.proc = self.proc, None
+        self.pending.clear()
+        if proc is None:
+            return
+        kill_process_group(proc)
+        proc.wait()
+
+    def disable(self, reason: str) -> None:
+        warn(f"garaga calldata worker disabled ({reason}); falling back to garaga CLI.")
+        self.enabled = False
+        self.stop()
+
+    def spawn(self, uvx_cmd: str) -> subprocess.Popen[bytes]:
+        import atexit
+
+        script = str(CALLDATA_WORKER_SCRIPT)
+        command = f"{uvx_cmd} --from garaga python {shlex.quote(script)}"
+        uvx_argv = split_plain_command(uvx_cmd)
+        argv = [*uvx_argv, "--from", "garaga", "python", script] if uvx_argv else None
+        proc = subprocess.Popen(
+            direct_argv(command, argv) or shell_argv(command),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            bufsize=0,
+            start_new_session=True,
+        )
+        atexit.register(self.stop)
+        return proc
+
+    def read_line(self, deadline: float) -> bytes:
+        import select
+
+        proc = cast(subprocess.Popen[bytes], self.proc)
+        stdout = cast(io.RawIOBase, proc.stdout)
+        while b"\n" not in self.pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not select.select([stdout], [], [], remaining)[0]:
+                raise TimeoutError("no reply before timeout")
+            chunk = os.read(stdout.fileno(), 1 << 16)
+            if not chunk:
+                raise EOFError("worker exited")
+            self.pending.extend(chunk)
+        line, _, rest = self.pending.partition(b"\n")
+        self.pending = bytearray(rest)
+        return bytes(line)
+
+    def calldata(
+        self,
+        uvx_cmd: str,
+        system: str,
+        vk_path: Path,
+        proof_path: Path,
+        public_inputs_path: Path | None,
+        timeout_secs: int,
+    ) -> list[str] | None:
+        if not self.enabled or system != "groth16":
+            return None
+        job = json_dumps_bytes(
+            {
+                "vk": str(vk_path),
+                "proof": str(proof_path),
+                "public_inputs": str(public_inputs_path) if public_inputs_path else None,
+            }
+        )
+        with self.lock:
+            # Another thread may have disabled the worker while this one waited on the lock.
+            if not self.enabled:
+                return None
+            try:
+                if not self.alive():
+                    self.stop()
+                    self.proc = self.spawn(uvx_cmd)
+                proc = cast(subprocess.Popen[bytes], self.proc)
+                stdin = cast(io.RawIOBase, proc.stdin)
+                stdin.write(job + b"\n")
+                reply = json_loads(self.read_line(time.monotonic() + timeout_secs))
+            except (OSError, EOFError, TimeoutError, ValueError) as exc:
+                self.disable(str(exc))
+                return None
+        if not isinstance(reply, dict) or not reply.get("ok"):
+            # Let the CLI run reproduce the failure with its own, fuller error output.
+            error = reply.get("error") if isinstance(reply, dict) else reply
+            warn(f"garaga calldata worker failed ({error}); retrying with garaga CLI.")
+            return None
+        values = reply.get("calldata")
+        if not isinstance(values, list) or not values:
+            return None
+        return to_hex_felts(values)
+
+
+GARAGA_WORKER = GaragaWorker()
+
+
+def parse_calldata_array(raw: str) -> object:
+    # `--format array` prints a flat Python list of ints or quoted felt strings: JSON once single
+    # quotes are swapped. Bare hex tokens (`[0x1, 0x2]`) are split by hand; to_hex_felts parses.
+    if not CALLDATA_ARRAY_RE.fullmatch(raw):
+        fail(f"Unable to parse garaga calldata output as array\nraw={raw[:200]}...")
+    try:
+        return json.loads(raw.replace("'", '"'))
+    except json.JSONDecodeError:
+        pass
+    inner = raw[1:-1].strip()
+    if not inner:
+        return []
+    tokens = [token.strip().strip("'\"") for token in inner.split(",")]
+    if any(len(token.split()) != 1 for token in tokens):
+        fail(f"Unable to parse garaga calldata output as array\nraw={raw[:200]}...")
+    return tokens
 
 
 def generate_full_proof_with_hints(
@@ -509,18 +1251,28 @@ def generate_full_proof_with_hints(
     public_inputs_path: Path | None,
     timeout_secs: int,
 ) -> list[str]:
-    parts = [
-        uvx_cmd,
-        "garaga calldata",
-        f"--system {shlex.quote(system)}",
-        f"--vk {shlex.quote(str(vk_path))}",
-        f"--proof {shlex.quote(str(proof_path))}",
-    ]
+    in_process_values = garaga_calldata_in_process(system, vk_path, proof_path, public_inputs_path)
+    if in_process_values is not None:
+        if not in_process_values:
+            fail("garaga calldata output is empty array")
+        return to_hex_felts(cast(list[object], in_process_values))
+    worker_values = GARAGA_WORKER.calldata(
+        uvx_cmd, system, vk_path, proof_path, public_inputs_path, timeout_secs
+    )
+    if worker_values is not None:
+        return worker_values
+
+    args = ["calldata", "--system", system, "--vk", str(vk_path), "--proof", str(proof_path)]
     if public_inputs_path:
-        parts.append(f"--public-inputs {shlex.quote(str(public_inputs_path))}")
-    parts.append("--format array")
-    cmd = " ".join(parts)
-    result = run_shell(cmd, timeout_secs=timeout_secs)
+        args.extend(["--public-inputs", str(public_inputs_path)])
+    args.extend(["--format", "array"])
+    cmd = " ".join([uvx_cmd, "garaga", *(shlex.quote(arg) for arg in args)])
+    uvx_argv = split_plain_command(uvx_cmd)
+    result, _ = run_shell_with_doubling(
+        cmd,
+        timeout_secs=timeout_secs,
+        argv=[*uvx_argv, "garaga", *args] if uvx_argv else None,
+    )
     if result.returncode != 0:
         fail(
             "Failed to run garaga calldata.\n"
@@ -531,13 +1283,10 @@ def generate_full_proof_with_hints(
     raw = result.stdout.strip()
     if not raw:
         fail("garaga calldata returned empty stdout")
-    try:
-        values: object = ast.literal_eval(raw)
-    except Exception as exc:  # noqa: BLE001
-        fail(f"Unable to parse garaga calldata output as array: {exc}\nraw={raw[:200]}...")
+    values = parse_calldata_array(raw)
     if not isinstance(values, list) or not values:
         fail("garaga calldata output is empty array")
-    return [to_hex_felt(v) for v in values]
+    return to_hex_felts(values)
 
 
 def resolve_public_inputs(public_inputs_path: Path | None, proof_path: Path) -> list[str]:
@@ -553,10 +1302,13 @@ def resolve_public_inputs(public_inputs_path: Path | None, proof_path: Path) ->
 
 
 def read_vk_n_public(path: Path) -> int | None:
-    if not path.is_file():
-        return None
+    # VK candidates are probed on every request; unchanged files come from the parse cache.
+    # A missing file or a directory raises OSError (no separate is_file() stat).
     try:
-        raw: object = json.loads(path.read_text())
+        stat = path.stat()
+        raw: object = load_json_snapshot(
+            str(path), stat.st_mtime_ns, stat.st_size, stat.st_ino
+        )
     except (OSError, json.JSONDecodeError):
         return None
     if not isinstance(raw, dict):
@@ -581,7 +1333,7 @@ def resolve_vk_path(vk_raw: str, public_inputs: list[str], is_v3: bool) -> Path:
         if not raw_path:
             return
         path = Path(raw_path).expanduser()
-        key = str(path.resolve()) if path.exists() else str(path)
+        key = os.path.abspath(path)
         if key in seen:
             return
         seen.add(key)
@@ -637,8 +1389,9 @@ def resolve_vk_path(vk_raw: str, public_inputs: list[str], is_v3: bool) -> Path:
 def maybe_load_precomputed_payload(path: Path | None) -> tuple[list[str], list[str]] | None:
     if path is None:
         return None
-    proof = parse_json_array_file(path, expected_key="proof")
-    public_inputs = parse_json_array_file(path, expected_key="public_inputs")
+    obj = load_json_file(path)
+    proof = extract_felt_array(obj, path, expected_key="proof")
+    public_inputs = extract_felt_array(obj, path, expected_key="public_inputs")
     return proof, public_inputs
 
 
@@ -693,10 +1446,14 @@ def build_payload(stdin_payload: Mapping[str, object]) -> GaragaPayload:
         or getenv_clean("HIDE_BALANCE_POOL_VERSION_DEFAULT")
     ).strip().lower()
     is_v3 = note_version == "v3"
+    dynamic_binding = bool_env("GARAGA_DYNAMIC_BINDING", False)
+    uvx_warmup: subprocess.Popen[bytes] | None = None
     try:
         vk_path_used: str | None = None
         vk_n_public: int | None = None
         if prove_cmd:
+            if precomputed_payload is None:
+                uvx_warmup = start_uvx_warmup(uvx_cmd, system)
             # Isolate per-request prover outputs to avoid cross-request overwrite races on shared paths.
             output_dir.mkdir(parents=True, exist_ok=True)
             request_temp_dir = Path(
@@ -711,6 +1468,7 @@ def build_payload(stdin_payload: Mapping[str, object]) -> GaragaPayload:
                 proof_path=proof_path,
                 public_inputs_path=public_inputs_path,
                 timeout_secs=timeout_secs,
+                context_path=request_temp_dir / "context.json",
             )
 
         if precomputed_payload is not None:
@@ -763,12 +1521,10 @@ def build_payload(stdin_payload: Mapping[str, object]) -> GaragaPayload:
                     f"action_hash_idx={action_hash_idx}). "
                     "Regenerate Garaga PK/VK and redeploy verifier."
                 )
-            root = to_hex_felt(public_inputs[root_idx])
-            nullifier = to_hex_felt(public_inputs[nullifier_idx])
+            root = public_inputs[root_idx]
+            nullifier = public_inputs[nullifier_idx]
             commitment_seed = f"{root}|{nullifier}|{intent_hash}|{nonce}".encode("utf-8")
-            commitment = to_hex_felt(
-                int.from_bytes(hashlib.sha256(commitment_seed).digest(), byteorder="big")
-            )
+            commitment = digest_to_felt(hashlib.sha256(commitment_seed).digest())
             note_commitment_raw = clean_optional_text(tx_context.get("note_commitment"))
             note_commitment = note_commitment_raw if note_commitment_raw else commitment
             denom_raw = clean_optional_text(tx_context.get("denom_id")) or clean_optional_text(
@@ -784,7 +1540,7 @@ def build_payload(stdin_payload: Mapping[str, object]) -> GaragaPayload:
                     spendable_at_unix = int(spendable_raw)
                 except ValueError:
                     spendable_at_unix = None
-        elif bool_env("GARAGA_DYNAMIC_BINDING", False):
+        elif dynamic_binding:
             nullifier, commitment = make_dynamic_binding(stdin_payload, intent_hash, nonce)
             public_inputs = apply_binding_to_public_inputs(public_inputs, nullifier, commitment)
         else:
@@ -813,6 +1569,7 @@ def build_payload(stdin_payload: Mapping[str, object]) -> GaragaPayload:
             payload["vk_n_public"] = vk_n_public
         return payload
     finally:
+        finish_uvx_warmup(uvx_warmup)
         if request_temp_dir is not None and not keep_temp_files:
             shutil.rmtree(request_temp_dir, ignore_errors=True)
 
@@ -870,18 +1627,18 @@ def run_prove_mode() -> None:
             "GARAGA_REAL_PROVER_CMD did not produce expected files; "
             f"retrying with fallback script {fallback_script}"
         )
-        fallback_cmd_parts = [
+        fallback_argv = [
             "python3",
-            shlex.quote(str(fallback_script)),
+            str(fallback_script),
             "--proof",
-            shlex.quote(str(proof_path)),
+            str(proof_path),
             "--public-inputs",
-            shlex.quote(str(public_inputs_path)),
+            str(public_inputs_path),
         ]
         if context_raw:
-            fallback_cmd_parts.extend(["--context", shlex.quote(context_raw)])
-        fallback_cmd = " ".join(fallback_cmd_parts)
-        fallback_result = run_shell(fallback_cmd, timeout_secs=timeout_secs)
+            fallback_argv.extend(["--context", context_raw])
+        fallback_cmd = shlex.join(fallback_argv)
+        fallback_result = run_shell(fallback_cmd, timeout_secs=timeout_secs, argv=fallback_argv)
         if fallback_result.returncode != 0:
             fail(
                 "Fallback prove.py execution failed.\n"
@@ -893,7 +1650,7 @@ def run_prove_mode() -> None:
     validate_proof_json_file(proof_path)
     _ = parse_json_array_file(public_inputs_path, expected_key="public_inputs")
 
-    sys.stdout.write(json.dumps({"ok": True}))
+    write_json_stdout({"ok": True})
 
 
 def run_warmup_mode() -> None:
@@ -926,18 +1683,19 @@ def run_warmup_mode() -> None:
         public_inputs_path=public_inputs_path,
         timeout_secs=timeout_secs,
     )
-    sys.stdout.write(
-        json.dumps(
-            {
-                "ok": True,
-                "warmed": True,
-                "proof_len": len(calldata),
-            }
-        )
+    write_json_stdout(
+        {
+            "ok": True,
+            "warmed": True,
+            "proof_len": len(calldata),
+        }
     )
 
 
+@functools.lru_cache(maxsize=16)
 def resolve_real_prover_cmd(raw_cmd: str) -> str:
+    # Path probes are constant per process; fail() raises, so only successful resolutions are
+    # cached and a missing-script error is re-evaluated on the next call.
     cmd = raw_cmd.strip()
     if not cmd:
         return cmd
@@ -947,10 +1705,9 @@ def resolve_real_prover_cmd(raw_cmd: str) -> str:
         Path("backend-rust/garaga-real-prover/prove.py"),
         Path("/app/garaga-real-prover/prove.py"),
     ]
-    fallback_path: str | None = next(
-        (str(candidate.resolve()) for candidate in fallback_candidates if candidate.is_file()),
-        None,
-    )
+    # Only probed once some literal in the command is actually missing (the common case is
+    # a valid path, which then costs no fallback stats at all).
+    fallback_paths: list[str | None] = []
 
     def replace_path_if_missing(path_literal: str) -> None:
         nonlocal cmd
@@ -958,7 +1715,19 @@ def resolve_real_prover_cmd(raw_cmd: str) -> str:
             return
         if Path(path_literal).expanduser().is_file():
             return
-        if not fallback_path:
+        if not fallback_paths:
+            fallback_paths.append(
+                next(
+                    (
+                        str(candidate.resolve())
+                        for candidate in fallback_candidates
+                        if candidate.is_file()
+                    ),
+                    None,
+                )
+            )
+        fallback_path = fallback_paths[0]
+        if fallback_path is None:
             fail(
                 "GARAGA_REAL_PROVER_CMD points to missing prover script path "
                 f"'{path_literal}', and no local fallback was found. "
@@ -969,13 +1738,7 @@ def resolve_real_prover_cmd(raw_cmd: str) -> str:
             f"using '{fallback_path}'",
             file=sys.stderr,
         )
-        replacement_path = fallback_path
-        if replacement_path is None:
-            fail(
-                "GARAGA_REAL_PROVER_CMD points to missing prover script path "
-                f"'{path_literal}', and no local fallback was found."
-            )
-        cmd = cmd.replace(path_literal, replacement_path)
+        cmd = cmd.replace(path_literal, fallback_path)
 
     for bad_path in (
         "/PATH/ASLI/garaga-real-prover/prove.py",
@@ -1016,6 +1779,7 @@ def run_test_mode() -> None:
     }
 
     payload_a = build_payload(sample_a)
+    clear_env_caches()
     payload_b = build_payload(sample_b)
     same_proof = payload_a["proof"] == payload_b["proof"]
     if same_proof:
@@ -1027,36 +1791,99 @@ def run_test_mode() -> None:
         "ok": True,
         "proof_a_len": len(payload_a["proof"]),
         "proof_b_len": len(payload_b["proof"]),
-        "proof_a_sha256": hashlib.sha256(
-            json.dumps(payload_a["proof"], separators=(",", ":")).encode("utf-8")
-        ).hexdigest(),
-        "proof_b_sha256": hashlib.sha256(
-            json.dumps(payload_b["proof"], separators=(",", ":")).encode("utf-8")
-        ).hexdigest(),
+        # Compact JSON bytes of a hex-string list match json.dumps(separators=(",", ":")).
+        "proof_a_sha256": hashlib.sha256(json_dumps_bytes(payload_a["proof"])).hexdigest(),
+        "proof_b_sha256": hashlib.sha256(json_dumps_bytes(payload_b["proof"])).hexdigest(),
     }
-    sys.stdout.write(json.dumps(result))
+    write_json_stdout(result)
+
+
+async def build_payloads_concurrently(
+    contexts: list[dict[str, object]],
+    max_parallel: int,
+) -> list[GaragaPayload | dict[str, str]]:
+    import asyncio
+
+    semaphore = asyncio.Semaphore(max(max_parallel, 1))
+
+    async def prove_one(ctx: dict[str, object]) -> GaragaPayload | dict[str, str]:
+        async with semaphore:
+            # build_payload blocks in subprocess waits, which release the GIL, so a worker
+            # thread per request overlaps external prover and garaga calldata runs.
+            try:
+                return await asyncio.to_thread(build_payload, ctx)
+            except ProverError as exc:
+                return {"error": exc.message}
+            except Exception as exc:  # noqa: BLE001
+                return {"error": f"{type(exc).__name__}: {exc}"}
+
+    return await asyncio.gather(*(prove_one(ctx) for ctx in contexts))
+
+
+def run_batch_mode() -> None:
+    contexts = parse_stdin_batch()
+    max_parallel = int(getenv_clean("GARAGA_MAX_PARALLEL", "4") or "4")
+    GARAGA_WORKER.enable()
+    import asyncio
+
+    results = asyncio.run(build_payloads_concurrently(contexts, max_parallel))
+    write_json_stdout(results)
+
+
+def run_daemon_mode() -> None:
+    # A long-lived caller pays interpreter start-up, imports, the Redis client and the
+    # env/parse caches once instead of per request.
+    GARAGA_WORKER.enable()
+    # Replies own the real stdout; anything in-process garaga prints goes to stderr instead.
+    out = sys.stdout.buffer
+    sys.stdout = sys.stderr
+    for line in sys.stdin.buffer:
+        if not line.strip():
+            continue
+        reply: GaragaPayload | dict[str, str]
+        try:
+            ctx = json_loads(line)
+            if not isinstance(ctx, dict):
+                raise ValueError("request line must be a JSON object")
+            reply = build_payload(cast(dict[str, object], ctx))
+        except ProverError as exc:
+            reply = {"error": exc.message}
+        except Exception as exc:  # noqa: BLE001
+            reply = {"error": f"{type(exc).__name__}: {exc}"}
+        out.write(json_dumps_bytes(reply) + b"\n")
+        out.flush()
 
 
 def main() -> None:
-    parser = argparse.ArgumentParser(add_help=False)
-    parser.add_argument("--prove", action="store_true")
-    parser.add_argument("--test", action="store_true")
-    parser.add_argument("--warmup", action="store_true")
-    args, _unknown = parser.parse_known_args()
+    # Bridge mode is spawned per request: scan flags directly instead of importing argparse,
+    # and keep batch-only (asyncio) and daemon-only (socket) imports inside those paths.
+    flags = set(sys.argv[1:])
 
-    if args.warmup:
+    if "--warmup" in flags:
         run_warmup_mode()
         return
-    if args.prove:
+    if "--prove" in flags:
         run_prove_mode()
         return
-    if args.test:
+    if "--test" in flags:
         run_test_mode()
         return
+    if "--batch" in flags:
+        run_batch_mode()
+        return
+    if "--daemon" in flags:
+        run_daemon_mode()
+        return
 
     stdin_payload = parse_stdin_payload()
-    payload = build_payload(stdin_payload)
-    sys.stdout.write(json.dumps(payload))
+    payload: GaragaPayload | None = None
+    daemon_sock = getenv_clean("GARAGA_DAEMON_SOCK")
+    if daemon_sock:
+        daemon_timeout_secs = int(getenv_clean("GARAGA_DAEMON_TIMEOUT_SECS", "180") or "180")
+        payload = request_prover_daemon(daemon_sock, stdin_payload, daemon_timeout_secs)
+    if payload is None:
+        payload = build_payload(stdin_payload)
+    write_json_stdout(payload)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Long-lived Groth16 calldata worker for `garaga_auto_prover.py` batch/daemon modes.
+
+Runs inside the garaga environment (`uvx --from garaga python garaga_calldata_worker.py`)
+so uvx resolution and the garaga import are paid once per worker instead of once per
+`garaga calldata` invocation.
+
+Request line:  {"vk": "<path>", "proof": "<path>", "public_inputs": "<path>" | null}
+Reply line:    {"ok": true, "calldata": ["0x..", ...]} or {"ok": false, "error": "..."}
+
+The calldata values are the same felts `garaga calldata --format array` prints.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+from garaga.starknet.groth16_contract_generator.calldata import (  # type: ignore[import-not-found]
+    groth16_calldata_from_vk_and_proof,
+)
+from garaga.starknet.groth16_contract_generator.parsing_utils import (  # type: ignore[import-not-found]
+    Groth16Proof,
+    Groth16VerifyingKey,
+)
+
+
+def calldata_for(job: dict[str, object]) -> list[str]:
+    vk = Groth16VerifyingKey.from_json(Path(str(job["vk"])))
+    public_inputs = job.get("public_inputs")
+    proof = Groth16Proof.from_json(
+        Path(str(job["proof"])),
+        Path(str(public_inputs)) if public_inputs else None,
+    )
+    return [hex(value) for value in groth16_calldata_from_vk_and_proof(vk, proof)]
+
+
+def main() -> None:
+    # Replies own the real stdout; anything garaga prints goes to stderr instead.
+    out = sys.stdout.buffer
+    sys.stdout = sys.stderr
+    for line in sys.stdin.buffer:
+        if not line.strip():
+            continue
+        try:
+            job = json.loads(line)
+            if not isinstance(job, dict):
+                raise ValueError("job line must be a JSON object")
+            reply: dict[str, object] = {"ok": True, "calldata": calldata_for(job)}
+        except Exception as exc:  # noqa: BLE001
+            reply = {"ok": False, "error": f"{type(exc).__name__}: {exc}"}
+        out.write(json.dumps(reply).encode("utf-8") + b"\n")
+        out.flush()
+
+
+if __name__ == "__main__":
+    main()
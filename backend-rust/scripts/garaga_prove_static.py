@@ -16,16 +16,23 @@ Optional env:
 - GARAGA_CONTEXT_PATH          request context JSON from backend
 - GARAGA_OUTPUT_DIR            output directory hint
 - GARAGA_REAL_PROVER_TIMEOUT_SECS (default: 180)
+- GARAGA_USE_SHELL             always run the command through a shell
+- GARAGA_LOGIN_SHELL           use `bash -lc` instead of `bash -c` when a shell is needed
 """
 
 from __future__ import annotations
 
 import os
+import shlex
+import shutil
 import subprocess
 import sys
 import json
 from pathlib import Path
 
+# Characters that need a real shell: operators, redirection, expansion, globbing, comments.
+SHELL_META_CHARS = frozenset("|&;<>()$`\\*?[]{}~!#\n")
+
 
 def fail(message: str) -> None:
     print(message, file=sys.stderr)
@@ -39,6 +46,25 @@ def getenv_required(name: str) -> str:
     return value
 
 
+def bool_env(name: str) -> bool:
+    return os.getenv(name, "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def command_argv(command: str) -> list[str]:
+    # Plain commands are exec'd directly; shell syntax (or GARAGA_USE_SHELL=1) goes through
+    # `bash -c`, or `bash -lc` with GARAGA_LOGIN_SHELL=1 for login-profile PATH setups.
+    if not bool_env("GARAGA_USE_SHELL") and not any(ch in SHELL_META_CHARS for ch in command):
+        try:
+            argv = shlex.split(command)
+        except ValueError:
+            argv = []
+        if argv and "=" not in argv[0] and shutil.which(argv[0]) is not None:
+            return argv
+    if bool_env("GARAGA_LOGIN_SHELL"):
+        return ["bash", "-lc", command]
+    return ["bash", "-c", command]
+
+
 def validate_json_array_or_object(path: Path, label: str) -> None:
     if not path.is_file():
         fail(f"{label} output file not found: {path}")
@@ -62,11 +88,10 @@ def main() -> None:
         pub_out.parent.mkdir(parents=True, exist_ok=True)
 
     proc = subprocess.run(
-        ["bash", "-lc", prove_cmd],
+        command_argv(prove_cmd),
         text=True,
         capture_output=True,
         timeout=timeout_secs,
-        env=os.environ.copy(),
         check=False,
     )
     if proc.returncode != 0:
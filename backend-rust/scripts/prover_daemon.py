@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Persistent Garaga prover daemon for `garaga_auto_prover.py` bridge mode.
+
+The bridge script is spawned once per `/api/v1/privacy/auto-submit` request, so every
+call pays interpreter start-up and module import cost before any proving work starts.
+This daemon keeps one warm process alive and answers bridge requests over a unix
+socket using length-prefixed JSON frames (4-byte big-endian size + UTF-8 JSON body).
+
+Request frame:  {"ctx": <stdin payload object>}
+Reply frame:    {"ok": true, "payload": <GaragaPayload>} or {"ok": false, "error": "..."}
+
+Required env (or --sock):
+- GARAGA_DAEMON_SOCK           unix socket path to listen on
+
+All other GARAGA_* settings are read by the daemon exactly as the bridge reads them.
+Bridge callers fall back to in-process payload generation when the socket is absent.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import socketserver
+import sys
+
+import garaga_auto_prover as bridge
+
+
+class ProverRequestHandler(socketserver.BaseRequestHandler):
+    def handle(self) -> None:
+        try:
+            request = bridge.recv_frame(self.request)
+        except (OSError, ValueError) as exc:
+            bridge.warn(f"Dropping malformed daemon request: {exc}")
+            return
+        ctx = request.get("ctx") if isinstance(request, dict) else None
+        if ctx is None:
+            ctx = {}
+        if not isinstance(ctx, dict):
+            reply: dict[str, object] = {"ok": False, "error": "ctx must be a JSON object"}
+        else:
+            try:
+                reply = {"ok": True, "payload": bridge.build_payload(ctx)}
+            except bridge.ProverError as exc:
+                reply = {"ok": False, "error": exc.message}
+            except Exception as exc:  # noqa: BLE001
+                reply = {"ok": False, "error": f"{type(exc).__name__}: {exc}"}
+        try:
+            bridge.send_frame(self.request, reply)
+        except OSError as exc:
+            bridge.warn(f"Failed to send daemon reply: {exc}")
+
+
+class ProverDaemonServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--sock",
+        default=bridge.getenv_clean("GARAGA_DAEMON_SOCK"),
+        help="Unix socket path to listen on (default: GARAGA_DAEMON_SOCK)",
+    )
+    args = parser.parse_args()
+    if not args.sock:
+        bridge.fail("Missing socket path: set GARAGA_DAEMON_SOCK or pass --sock")
+
+    bridge.GARAGA_WORKER.enable()
+    if os.path.exists(args.sock):
+        os.unlink(args.sock)
+    with ProverDaemonServer(args.sock, ProverRequestHandler) as server:
+        os.chmod(args.sock, 0o600)
+        print(f"[garaga-prover-daemon] listening on {args.sock}", file=sys.stderr)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if os.path.exists(args.sock):
+                os.unlink(args.sock)
+
+
+if __name__ == "__main__":
+    main()
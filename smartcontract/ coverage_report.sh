@@ -6,6 +6,22 @@ set -e
 
 echo "📊 Generating test coverage report..."
 
+# Skip the run when no Cairo source, test, or manifest changed since the last report
+# (FORCE_COVERAGE=1 always regenerates)
+HASH_FILE=".coverage_hash"
+tree_hash() {
+    find src tests -type f -name '*.cairo' -print0 \
+        | LC_ALL=C sort -z \
+        | xargs -0 sha256sum
+    sha256sum Scarb.toml
+}
+CURRENT_HASH=$(tree_hash | sha256sum | cut -d' ' -f1)
+if [ "${FORCE_COVERAGE:-0}" != "1" ] && [ -f coverage/lcov.info ] \
+    && [ "$(cat "$HASH_FILE" 2>/dev/null)" = "$CURRENT_HASH" ]; then
+    echo "coverage up-to-date"
+    exit 0
+fi
+
 # Create coverage directory
 mkdir -p coverage
 
@@ -37,5 +53,7 @@ if command -v genhtml &> /dev/null; then
     genhtml coverage/lcov.info -o coverage/html-detailed
 fi
 
+echo "$CURRENT_HASH" > "$HASH_FILE"
+
 echo "✅ Coverage report generated in coverage/"
 echo "📄 Open coverage/html/index.html in browser"
\ No newline at end of file